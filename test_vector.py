@@ -1,3 +1,7 @@
+from math import sqrt
+
+import numpy as np
+
 from vector import *
 
 a = Vector([1, 1])
@@ -6,6 +10,55 @@ b = Vector([3, 3])
 # Tests
 assert a.scale(2) == Vector([2, 2])
 
+for bad in (5, [[1, 2], [3, 4]]):
+    try:
+        Vector(bad)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError('Vector({0!r}) should raise TypeError'.format(bad))
+
+for bad in (np.int64, object, np.float16, np.longdouble):
+    try:
+        Vector([1, 2], dtype=bad)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError('dtype {0!r} should raise TypeError'.format(bad))
+
+assert Vector([1, 2], dtype=np.float32).scale(2) == Vector([2, 4])
+
+v = Vector([3, 4])
+assert np.linalg.norm(v) == v.magnitude
+assert np.shares_memory(np.asarray(v), v._arr)
+assert not np.asarray(v).flags.writeable
+assert np.asarray(v, dtype=np.float32).dtype == np.float32
+assert len(v) == 2 and list(v) == [3.0, 4.0]
+try:
+    v.__array__(np.float32, copy=False)
+except ValueError:
+    pass
+else:
+    raise AssertionError('casting with copy=False should raise ValueError')
+assert np.float64(2) * v == v.scale(2) and 2 * v == v.scale(2)
+assert np.matmul(v, v) == v.dot(v)
+assert np.allclose(np.sqrt(v), [sqrt(3), 2])
+
+for op in (Vector.__add__, Vector.__sub__):
+    for other in (Vector([1]), Vector([1, 2])):
+        try:
+            op(Vector([1, 2, 3]), other)
+        except TypeError:
+            pass
+        else:
+            raise AssertionError('Vectors of different size should raise TypeError')
+
+x = np.array([3., 4.])
+v = Vector(x)
+assert v.magnitude == 5
+x[0] = 0
+assert v == Vector([3, 4]) and v.magnitude == 5
+
 
 # Playground
 print(a.normalized, b.normalized)
@@ -80,6 +133,19 @@ print('Is parallel', b1.is_parallel_with(b2))
 print('Is parallel', c1.is_parallel_with(c2))
 print('Is parallel', d1.is_parallel_with(d2))
 
+assert list(Vector.batch_is_parallel(
+    [b1.coordinates, c1.coordinates],
+    [b2.coordinates, c2.coordinates]
+)) == [b1.is_parallel_with(b2), c1.is_parallel_with(c2)]
+assert list(Vector.batch_is_parallel(
+    [a1.coordinates, d1.coordinates],
+    [a2.coordinates, d2.coordinates]
+)) == [a1.is_parallel_with(a2), d1.is_parallel_with(d2)]
+assert list(Vector.batch_is_parallel(
+    [[1e-3, 0], [1, 1e-3]], [[0, 1], [1, 0]], tolerance=1e-2
+)) == [Vector([1e-3, 0]).is_parallel_with(Vector([0, 1]), tolerance=1e-2),
+       Vector([1, 1e-3]).is_parallel_with(Vector([1, 0]), tolerance=1e-2)]
+
 print('Is orthogonal', a1.is_orthogonal_with(a2))
 print('Is orthogonal', b1.is_orthogonal_with(b2))
 print('Is orthogonal', c1.is_orthogonal_with(c2))
@@ -103,6 +169,24 @@ b = Vector([6.404, -9.144, 2.759, 8.718])
 print(v.component_orthogonal_to(b))
 print(v.component_parallel_to(b))
 
+for s, t in ((v, b), (Vector([1, 2, 3]), Vector([2, 1, 1])),
+             (Vector(range(300)), Vector(range(300, 0, -1))),
+             (Vector(np.random.rand(200000)), Vector(np.random.rand(200000)))):
+    assert np.allclose(s.component_orthogonal_to(t).coordinates,
+                       (s - s.component_parallel_to(t)).coordinates)
+
+rows = [v, b, Vector([1, 2, 3, 4]), Vector([-0.5, 0.25, 8, 1])]
+batch = VectorBatch.from_vectors(rows)
+others = VectorBatch.from_vectors(rows[::-1])
+assert len(batch) == len(rows)
+assert np.allclose(batch.dot_row(others),
+                   [r.dot(o) for r, o in zip(rows, rows[::-1])])
+assert np.allclose(batch.norms(), [r.magnitude for r in rows])
+assert np.allclose(batch.normalize_all().data,
+                   [r.normalized.coordinates for r in rows])
+assert np.allclose(batch.project_onto(b).data,
+                   [r.component_parallel_to(b).coordinates for r in rows])
+
 
 # 13 Cross Product
 v = Vector([8.462, 7.893, -8.187])
@@ -113,4 +197,12 @@ print(x)
 print(x.magnitude)
 print(x.magnitude / 2)
 
+pairs = [(v, w), (w, v), (Vector([1, 0, 0]), Vector([0, 1, 0])),
+         (Vector([-1.5, 2, 7]), Vector([3, 3, -0.25]))]
+assert np.allclose(
+    cross_product_batch([p.coordinates for p, _ in pairs],
+                        [q.coordinates for _, q in pairs]),
+    [cross_product(p, q).coordinates for p, q in pairs]
+)
+
 print(sqrt(11.205 ** 2 + 97.609 ** 2 + 105.685 ** 2))
\ No newline at end of file
@@ -1,10 +1,39 @@
-from math import sqrt, acos, degrees, pi
-from decimal import Decimal
+from math import acos, degrees, hypot
 from numbers import Number
-from typing import List, Any
+from typing import Any, Iterator, List, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    from scipy.linalg.blas import ddot, sdot
+except ImportError:
+    _blas_dot = {}
+else:
+    _blas_dot = {np.dtype(np.float64): ddot, np.dtype(np.float32): sdot}
 
 DEFAULT_TOLERANCE = 1e-10
 
+# coordinate types a vector can be stored as
+FLOAT_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+# vectors up to this length use math.hypot for their magnitude
+HYPOT_MAX_LENGTH = 8
+
+# vectors up to this length call the scipy blas dot directly, when available
+BLAS_DOT_MAX_LENGTH = 10000
+
+# vectors shorter than this use the numba dot kernel when blas can't be
+# called directly, e.g. without scipy
+NUMBA_DOT_MAX_LENGTH = 2048
+
+# vectors from this length on use the multithreaded orthogonal kernel
+PARALLEL_ORTHOGONAL_MIN_LENGTH = 100000
+
 
 '''
 ISSUES
@@ -12,6 +41,49 @@ ISSUES
 '''
 
 
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _dot_kernel(a, b):
+        s = 0.0
+        for i in range(a.shape[0]):
+            s += a[i] * b[i]
+        return s
+
+    @njit(cache=True, fastmath=True)
+    def _orthogonal_kernel(a, b):
+        ab = 0.0
+        bb = 0.0
+        for i in range(a.shape[0]):
+            ab += a[i] * b[i]
+            bb += b[i] * b[i]
+        out = np.empty_like(a)
+        if bb == 0.0:
+            return bb, out
+        weight = ab / bb
+        for i in range(a.shape[0]):
+            out[i] = a[i] - weight * b[i]
+        return bb, out
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _orthogonal_kernel_parallel(a, b):
+        ab = 0.0
+        bb = 0.0
+        for i in prange(a.shape[0]):
+            ab += a[i] * b[i]
+            bb += b[i] * b[i]
+        out = np.empty_like(a)
+        if bb == 0.0:
+            return bb, out
+        weight = ab / bb
+        for i in prange(a.shape[0]):
+            out[i] = a[i] - weight * b[i]
+        return bb, out
+else:
+    _dot_kernel = None
+    _orthogonal_kernel = None
+    _orthogonal_kernel_parallel = None
+
+
 class CannotNormalizeZeroVectorError(Exception):
     pass
 
@@ -24,23 +96,67 @@ class NoUniqueOrthogonalComponentError(Exception):
     pass
 
 
-class Vector(object):
+class Vector:
+
+    __slots__ = ('_arr', 'length', '_magnitude', '_normalized')
 
-    def __init__(self, coordinates: List) -> None:
+    def __init__(self, coordinates: List, dtype: Any = np.float64) -> None:
         """
         Vector object has a set of coordinates and a length.
 
         The items of the coordinates list provided by the user
-        are transformed to Decimal for consistency and stored in
-        a tuple object.
+        are stored in a contiguous floating point numpy array,
+        float64 by default, so that all arithmetic runs in numpy's
+        vectorized loops. Passing np.float32 halves the memory
+        traffic of long vectors at the cost of ~7 significant digits
+        instead of ~16.
 
         The length of the vector denotes the number of dimensions.
 
         :param coordinates: list of real numbers defining
         the vector coordinates
+        :param dtype: np.float64 or np.float32
+        """
+        if np.dtype(dtype) not in FLOAT_DTYPES:
+            raise TypeError('Coordinates dtype must be float64 or float32.')
+
+        # copied, so later changes to the caller's array can't reach
+        # the cached magnitude and normalized vector
+        self._arr = np.array(coordinates, dtype=dtype)
+
+        if self._arr.ndim != 1:
+            raise TypeError('Coordinates must be a flat list of numbers.')
+
+        self.length = self._arr.shape[0]
+        self._magnitude = None
+        self._normalized = None
+
+    @property
+    def coordinates(self) -> Tuple[float, ...]:
         """
-        self.coordinates = tuple(map(Decimal, coordinates))
-        self.length = len(coordinates)
+        Coordinates of itself.
+
+        :return: tuple with the coordinates of the vector
+        """
+        return tuple(self._arr.tolist())
+
+    @classmethod
+    def _from_array(cls, arr: np.ndarray) -> 'Vector':
+        """
+        Build a vector around an existing float array, skipping the
+        conversion done in the constructor. Meant for results of
+        internal operations only, the array and its dtype are used
+        as is.
+
+        :param arr: one dimensional float array
+        :return: vector backed by the given array
+        """
+        vector = cls.__new__(cls)
+        vector._arr = arr
+        vector.length = arr.shape[0]
+        vector._magnitude = None
+        vector._normalized = None
+        return vector
 
     def scale(self, scalar: Number) -> 'Vector':
         """
@@ -52,14 +168,9 @@ class Vector(object):
         :param scalar: real number to scale the vector with
         :return: scaled vector
         """
-        try:
-            scalar = Decimal(scalar)
-        except Exception as err:
-            raise err
-
-        return Vector([c * scalar for c in self.coordinates])
+        return Vector._from_array(self._arr * float(scalar))
 
-    def dot(self, vector: 'Vector') -> Decimal:
+    def dot(self, vector: 'Vector') -> float:
         """
         Calculate the dot product of itself with provided vector.
 
@@ -76,46 +187,106 @@ class Vector(object):
         if self.length != vector.length:
             raise TypeError('Vectors must have equal size.')
 
-        return sum([a * b for a, b in zip(self.coordinates, vector.coordinates)])
+        # unrolled on python floats for the shortest vectors, where any
+        # numpy or numba call costs more than the arithmetic itself
+        if 2 <= self.length <= 4:
+            a = self._arr.tolist()
+            b = vector._arr.tolist()
+            if self.length == 2:
+                return a[0] * b[0] + a[1] * b[1]
+            if self.length == 3:
+                return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+            return a[0] * b[0] + a[1] * b[1] + a[2] * b[2] + a[3] * b[3]
+
+        blas_dot = _blas_dot.get(self._arr.dtype)
+        if (blas_dot is not None and self.length <= BLAS_DOT_MAX_LENGTH and
+                self._arr.dtype == vector._arr.dtype):
+            return float(blas_dot(self._arr, vector._arr))
+
+        if (_dot_kernel is not None and self.length < NUMBA_DOT_MAX_LENGTH and
+                self._arr.dtype in FLOAT_DTYPES and
+                vector._arr.dtype in FLOAT_DTYPES):
+            return _dot_kernel(self._arr, vector._arr)
+
+        return float(self._arr @ vector._arr)
 
     def component_orthogonal_to(self, vector: 'Vector') -> 'Vector':
         """
+        Remove from itself its projection onto the provided vector.
+
+        With numba available, both dot products and the subtraction
+        are fused in a single kernel reading each array twice, split
+        across threads for long vectors. The kernel writes its output
+        in the input dtype, so it is only used for vectors sharing one
+        of FLOAT_DTYPES.
 
         :param vector: vector to be projected onto
         :return: projection's orthogonal component
         """
+        if (_orthogonal_kernel is not None and
+                isinstance(vector, Vector) and
+                self.length == vector.length and
+                self._arr.dtype == vector._arr.dtype and
+                self._arr.dtype in FLOAT_DTYPES):
+            if self.length >= PARALLEL_ORTHOGONAL_MIN_LENGTH:
+                kernel = _orthogonal_kernel_parallel
+            else:
+                kernel = _orthogonal_kernel
+            denominator, arr = kernel(self._arr, vector._arr)
+            if denominator == 0:
+                raise NoUniqueOrthogonalComponentError
+            return Vector._from_array(arr)
+
         try:
             projection = self.component_parallel_to(vector)
         except NoUniqueParallelComponentError:
             raise NoUniqueOrthogonalComponentError
 
-        return self - projection
+        return Vector._from_array(self._arr - projection._arr)
 
     def component_parallel_to(self, vector: 'Vector') -> 'Vector':
         """
+        Project itself onto the provided vector.
 
-        :param vector:
-        :return:
+        Scale the provided vector by (self . v) / (v . v), which
+        avoids building the normalized basis vector.
+
+        :param vector: vector to be projected onto
+        :return: projection's parallel component
         """
-        try:
-            basis = vector.normalized
-        except CannotNormalizeZeroVectorError:
+        if not isinstance(vector, Vector):
+            raise TypeError('Items must be of type Vector.')
+
+        if self.length != vector.length:
+            raise TypeError('Vectors must have equal size.')
+
+        v = vector._arr
+        denominator = float(v @ v)
+        if denominator == 0:
             raise NoUniqueParallelComponentError
 
-        weight = self.dot(basis)
-        return basis.scale(weight)
+        return Vector._from_array(v * (float(self._arr @ v) / denominator))
 
     @property
-    def magnitude(self) -> Decimal:
+    def magnitude(self) -> float:
         """
         Magnitude of itself.
 
         Calculate the magnitude by taking the square root of the
-        sum of its squared coordinates.
+        sum of its squared coordinates. Short vectors go through
+        math.hypot, which avoids overflow and underflow of the
+        intermediate squares, longer ones through numpy.
+
+        The result is cached, vectors are never mutated in place.
 
         :return: euclidean distance from its origin to its tip
         """
-        return Decimal(sqrt(sum([e ** 2 for e in self.coordinates])))
+        if self._magnitude is None:
+            if self.length <= HYPOT_MAX_LENGTH:
+                self._magnitude = hypot(*self._arr.tolist())
+            else:
+                self._magnitude = float(np.linalg.norm(self._arr))
+        return self._magnitude
 
     @property
     def normalized(self) -> 'Vector':
@@ -126,12 +297,16 @@ class Vector(object):
         Calculate the normalized vector by scaling itself by a
         value equal to 1 divided by its magnitude.
 
+        The result is cached, vectors are never mutated in place.
+
         :return: normalized vector
         """
-        try:
-            return self.scale(Decimal(1) / self.magnitude)
-        except ZeroDivisionError:
-            raise CannotNormalizeZeroVectorError
+        if self._normalized is None:
+            try:
+                self._normalized = self.scale(1 / self.magnitude)
+            except ZeroDivisionError:
+                raise CannotNormalizeZeroVectorError
+        return self._normalized
 
     def is_zero(self, tolerance: Number = DEFAULT_TOLERANCE) -> bool:
         """
@@ -139,18 +314,27 @@ class Vector(object):
         equal to zero (the euclidean distance between its origin
         and its tip is zero).
 
+        The squared magnitude is compared against the squared
+        tolerance, so no square root is taken.
+
         :param tolerance: error margin for decimal operations
         :return: True if its magnitude is zero, False otherwise
         """
-        return self.magnitude < tolerance
+        return self.dot(self) < tolerance * tolerance
 
-    def is_parallel_with(self, vector: 'Vector') -> bool:
+    def is_parallel_with(self,
+                         vector: 'Vector',
+                         tolerance: Number = DEFAULT_TOLERANCE) -> bool:
         """
         Two vectors are parallel when they have the same direction
         (the angle between them is 0 or 180 degrees) or at least one
         of them is the zero vector.
 
+        The cosine of the angle is compared against 1 and -1 directly,
+        acos is ill-conditioned around these values.
+
         :param vector: vector to be compared with
+        :param tolerance: error margin for the cosine of the angle
         :return: True if vectors are parallel, False otherwise
         """
         if not isinstance(vector, Vector):
@@ -159,12 +343,46 @@ class Vector(object):
         if self.length != vector.length:
             raise TypeError('Vectors must have equal size.')
 
-        return (
-            self.is_zero() or
-            vector.is_zero() or
-            self.angle_with(vector) == 0 or
-            self.angle_with(vector) == pi
-        )
+        if self.is_zero() or vector.is_zero():
+            return True
+
+        p = self.dot(vector) / (self.magnitude * vector.magnitude)
+        return 1 - abs(p) < tolerance
+
+    @staticmethod
+    def batch_is_parallel(a: Any,
+                          b: Any,
+                          tolerance: Number = DEFAULT_TOLERANCE) -> np.ndarray:
+        """
+        Check many pairs of vectors for parallelism at once, with the
+        same rules as is_parallel_with.
+
+        Pairs are given as rows of two (N, d) arrays, all checks are
+        computed by a handful of numpy calls instead of N method calls.
+
+        :param a: (N, d) array with the first vector of each pair
+        :param b: (N, d) array with the second vector of each pair
+        :param tolerance: error margin for the cosine of the angle
+        :return: (N,) boolean array, True where the pair is parallel
+        """
+        a = np.asarray(a, dtype=np.float64)
+        b = np.asarray(b, dtype=np.float64)
+
+        if a.ndim != 2 or a.shape != b.shape:
+            raise TypeError('Items must be (N, d) arrays of equal size.')
+
+        dots = np.einsum('ij,ij->i', a, b)
+        aa = np.einsum('ij,ij->i', a, a)
+        bb = np.einsum('ij,ij->i', b, b)
+
+        # zero vectors are detected with the default tolerance, as
+        # is_zero() does in is_parallel_with
+        zero = DEFAULT_TOLERANCE * DEFAULT_TOLERANCE
+        is_zero = (aa < zero) | (bb < zero)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            p = dots / np.sqrt(aa * bb)
+
+        return is_zero | (1 - np.abs(p) < tolerance)
 
     def is_orthogonal_with(self,
                            vector: 'Vector',
@@ -186,11 +404,14 @@ class Vector(object):
 
         return abs(self.dot(vector)) < tolerance
 
-    def angle_with(self, vector: 'Vector', radians: bool = True) -> Decimal:
+    def angle_with(self, vector: 'Vector', radians: bool = True) -> float:
         """
         Angle between two vectors is the result of the dot product between
         their normalized vectors.
 
+        The cosine is clamped to [-1, 1] to absorb rounding errors
+        before taking its arc cosine.
+
         :param vector: vector to be compared with
         :param radians: True will return the the angle value in radians,
         False will return angle value in degrees
@@ -203,16 +424,19 @@ class Vector(object):
         if self.length != vector.length:
             raise TypeError('Vectors must have equal size.')
 
-        u1 = self.normalized
-        u2 = vector.normalized
-        p = u1.dot(u2)
+        magnitudes = self.magnitude * vector.magnitude
+        if magnitudes == 0:
+            raise CannotNormalizeZeroVectorError
+
+        p = self.dot(vector) / magnitudes
+        p = -1.0 if p < -1.0 else 1.0 if p > 1.0 else p
 
-        teta = acos(round(p, 3))
+        teta = acos(p)
 
         if radians:
-            return Decimal(teta)
+            return teta
         else:
-            return Decimal(degrees(teta))
+            return degrees(teta)
 
     def __add__(self, other: Any) -> 'Vector':
         """
@@ -223,9 +447,11 @@ class Vector(object):
         :return: resulted vector
         """
         if isinstance(other, Vector):
-            return Vector([a + b for a, b in zip(self.coordinates, other.coordinates)])
+            if self.length != other.length:
+                raise TypeError('Vectors must have equal size.')
+            return Vector._from_array(self._arr + other._arr)
         elif isinstance(other, Number):
-            return Vector([e + Decimal(other) for e in self.coordinates])
+            return Vector._from_array(self._arr + float(other))
         else:
             raise TypeError('Addition argument must be a vector or a scalar.')
 
@@ -238,9 +464,11 @@ class Vector(object):
         :return: resulted vector
         """
         if isinstance(other, Vector):
-            return Vector([a - b for a, b in zip(self.coordinates, other.coordinates)])
+            if self.length != other.length:
+                raise TypeError('Vectors must have equal size.')
+            return Vector._from_array(self._arr - other._arr)
         elif isinstance(other, Number):
-            return Vector([e - Decimal(other) for e in self.coordinates])
+            return Vector._from_array(self._arr - float(other))
         else:
             raise TypeError('Subtraction argument must be a vector or a scalar.')
 
@@ -259,6 +487,18 @@ class Vector(object):
         else:
             raise TypeError('Operation not supported.')
 
+    def __rmul__(self, other: Any) -> 'Vector':
+        """
+        Reflected multiplication operator, supports scaling it by a real
+        number placed on the left, including numpy scalars.
+
+        :param other: scalar
+        :return: scaled vector
+        """
+        if isinstance(other, Number):
+            return self.scale(other)
+        return NotImplemented
+
     def __eq__(self, vector: 'Vector') -> bool:
         """
         Equality operator, checks if the all coordinates of two vectors are
@@ -270,13 +510,53 @@ class Vector(object):
         if not isinstance(vector, Vector) or self.length != vector.length:
             return False
 
-        is_equal = True
-        for i in range(self.length):
-            if self.coordinates[i] != vector.coordinates[i]:
-                is_equal = False
-                break
+        return bool((self._arr == vector._arr).all())
+
+    # vectors compare by value, keep them unhashable
+    __hash__ = None
 
-        return is_equal
+    # numpy scalars defer to __rmul__ instead of converting the vector
+    # through __array__ and returning a bare ndarray
+    __array_priority__ = 1000
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        """
+        Numpy array protocol, lets vectors be passed to numpy routines
+        without converting their coordinates.
+
+        :param dtype: type to cast the coordinates to, if any
+        :param copy: True to always return a copy, False to raise
+        ValueError when a copy can't be avoided
+        :return: read-only view of the coordinates, or a copy
+        """
+        if copy:
+            return np.array(self._arr, dtype=dtype)
+
+        if dtype is not None and np.dtype(dtype) != self._arr.dtype:
+            if copy is False:
+                raise ValueError('Casting the coordinates to {0} requires '
+                                 'a copy.'.format(np.dtype(dtype)))
+            return self._arr.astype(dtype)
+
+        arr = self._arr.view()
+        arr.flags.writeable = False
+        return arr
+
+    def __len__(self) -> int:
+        """
+        Number of dimensions of itself.
+
+        :return: vector length
+        """
+        return self.length
+
+    def __iter__(self) -> Iterator[float]:
+        """
+        Iterate over the coordinates.
+
+        :return: iterator over the coordinates, as floats
+        """
+        return iter(self._arr.tolist())
 
     def __repr__(self) -> str:
         """
@@ -284,7 +564,96 @@ class Vector(object):
 
         :return: all coordinates of the vector, comma separated, as string
         """
-        return '[{0}]'.format(', '.join(map(str, self.coordinates)))
+        return '[{0}]'.format(', '.join(map(str, self._arr.tolist())))
+
+
+class VectorBatch:
+
+    def __init__(self, data: Any) -> None:
+        """
+        VectorBatch object holds many vectors of the same size as the
+        rows of a single (N, d) float64 array, so that an operation
+        applied to all of them costs one numpy call instead of N.
+
+        :param data: (N, d) array-like, one vector per row
+        """
+        self.data = np.ascontiguousarray(data, dtype=np.float64)
+
+        if self.data.ndim != 2:
+            raise TypeError('Batch data must be a two dimensional array.')
+
+    @classmethod
+    def from_vectors(cls, vectors: List[Vector]) -> 'VectorBatch':
+        """
+        Stack vectors of equal size into a batch.
+
+        :param vectors: list of vectors, all of the same size
+        :return: batch with one row per vector
+        """
+        return cls(np.stack([v._arr for v in vectors]))
+
+    def dot_row(self, other: 'VectorBatch') -> np.ndarray:
+        """
+        Row-wise dot product of itself with another batch.
+
+        :param other: batch with the same shape
+        :return: (N,) array, the dot product of each pair of rows
+        """
+        if not isinstance(other, VectorBatch):
+            raise TypeError('Items must be of type VectorBatch.')
+
+        if self.data.shape != other.data.shape:
+            raise TypeError('Batches must have equal shape.')
+
+        return np.einsum('ij,ij->i', self.data, other.data)
+
+    def norms(self) -> np.ndarray:
+        """
+        Magnitude of every vector in the batch.
+
+        :return: (N,) array of magnitudes
+        """
+        return np.linalg.norm(self.data, axis=1)
+
+    def normalize_all(self) -> 'VectorBatch':
+        """
+        Normalize every vector in the batch.
+
+        :return: batch of unit vectors
+        """
+        norms = self.norms()
+        if not norms.all():
+            raise CannotNormalizeZeroVectorError
+
+        return VectorBatch(self.data / norms[:, None])
+
+    def project_onto(self, vector: Vector) -> 'VectorBatch':
+        """
+        Project every vector in the batch onto the provided vector.
+
+        :param vector: vector to be projected onto
+        :return: batch of projections' parallel components
+        """
+        if not isinstance(vector, Vector):
+            raise TypeError('Items must be of type Vector.')
+
+        if self.data.shape[1] != vector.length:
+            raise TypeError('Vectors must have equal size.')
+
+        b = vector._arr
+        denominator = float(b @ b)
+        if denominator == 0:
+            raise NoUniqueParallelComponentError
+
+        return VectorBatch(((self.data @ b) / denominator)[:, None] * b[None, :])
+
+    def __len__(self) -> int:
+        """
+        Number of vectors in the batch.
+
+        :return: number of rows
+        """
+        return self.data.shape[0]
 
 
 def cross_product(v1: Vector, v2: Vector) -> Vector:
@@ -297,11 +666,31 @@ def cross_product(v1: Vector, v2: Vector) -> Vector:
     :param v2: second vector
     :return: resulting vector
     """
-    v = v1.coordinates
-    w = v2.coordinates
+    v = v1._arr.tolist()
+    w = v2._arr.tolist()
 
     x = v[1] * w[2] - w[1] * v[2]
     y = -(v[0] * w[2] - w[0] * v[2])
     z = v[0] * w[1] - w[0] * v[1]
 
-    return Vector([x, y, z])
+    return Vector._from_array(np.array([x, y, z], dtype=np.result_type(v1._arr, v2._arr)))
+
+
+def cross_product_batch(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Calculate the cross products of many pairs of 3D vectors at once.
+
+    Pairs are given as rows of two (N, 3) arrays, the products are
+    computed by a single numpy call instead of N calls to cross_product.
+
+    :param a: (N, 3) array with the first vector of each pair
+    :param b: (N, 3) array with the second vector of each pair
+    :return: (N, 3) array with the resulting vectors
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+
+    if a.ndim != 2 or a.shape[1] != 3 or a.shape != b.shape:
+        raise TypeError('Items must be (N, 3) arrays of equal size.')
+
+    return np.cross(a, b)